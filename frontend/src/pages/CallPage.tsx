@@ -1,7 +1,7 @@
 import { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { callsApi, Call } from '../services/api';
+import { callsApi, Call, MAX_INJECTED_CONTEXT_LENGTH } from '../services/api';
 import { socketService } from '../services/socket';
 import './CallPage.css';
 
@@ -91,6 +91,9 @@ export function CallPage() {
       setContextRequest(null); // Clear the pending context request
       queryClient.invalidateQueries({ queryKey: ['call', callSid] });
     },
+    onError: (error: any) => {
+      alert(`Error injecting context: ${error.response?.data?.error || error.message}`);
+    },
   });
 
   const sendDTMFMutation = useMutation({
@@ -296,8 +299,12 @@ export function CallPage() {
                 placeholder="Enter instructions or context to inject into the conversation..."
                 value={contextInput}
                 onChange={(e) => setContextInput(e.target.value)}
+                maxLength={MAX_INJECTED_CONTEXT_LENGTH}
                 rows={4}
               />
+              <div className="context-char-count">
+                {contextInput.length}/{MAX_INJECTED_CONTEXT_LENGTH}
+              </div>
               <button
                 onClick={() => contextInput.trim() && injectContextMutation.mutate(contextInput)}
                 disabled={injectContextMutation.isPending || !contextInput.trim()}
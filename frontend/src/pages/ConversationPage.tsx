@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { smsApi, SmsMessage, incomingConfigsApi, AvailableNumber } from '../services/api';
+import { formatTime, formatDateTime } from '../utils/dateFormat';
 import './ConversationPage.css';
 
 export function ConversationPage() {
@@ -109,20 +110,10 @@ export function ConversationPage() {
     const isToday = date.toDateString() === now.toDateString();
 
     if (isToday) {
-      return date.toLocaleTimeString('en-US', {
-        hour: 'numeric',
-        minute: '2-digit',
-        hour12: true
-      });
+      return formatTime(date);
     }
 
-    return date.toLocaleString('en-US', {
-      month: 'short',
-      day: 'numeric',
-      hour: 'numeric',
-      minute: '2-digit',
-      hour12: true
-    });
+    return formatDateTime(date);
   };
 
   const getStatusIcon = (status: string) => {
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { conversationsApi, Conversation, incomingConfigsApi, AvailableNumber } from '../services/api';
+import { formatShortDate } from '../utils/dateFormat';
 import './ConversationsListPage.css';
 
 export function ConversationsListPage() {
@@ -78,10 +79,7 @@ export function ConversationsListPage() {
     if (diffHours < 24) return `${diffHours}h ago`;
     if (diffDays < 7) return `${diffDays}d ago`;
 
-    return date.toLocaleDateString('en-US', {
-      month: 'short',
-      day: 'numeric'
-    });
+    return formatShortDate(date);
   };
 
   const getConversationName = (conversation: Conversation) => {
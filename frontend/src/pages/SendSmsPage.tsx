@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { smsApi, conversationsApi, incomingConfigsApi, AvailableNumber, Conversation, SmsMessage } from '../services/api';
+import { formatTime } from '../utils/dateFormat';
 import './SendSmsPage.css';
 
 export function SendSmsPage() {
@@ -204,11 +205,7 @@ export function SendSmsPage() {
 
   const formatTimestamp = (timestamp: string) => {
     const date = new Date(timestamp);
-    return date.toLocaleTimeString('en-US', {
-      hour: 'numeric',
-      minute: '2-digit',
-      hour12: true
-    });
+    return formatTime(date);
   };
 
   const characterCount = message.length;
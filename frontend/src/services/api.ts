@@ -5,6 +5,9 @@ import axios from 'axios';
 const API_BASE_URL = import.meta.env.VITE_API_URL || (typeof window !== 'undefined' ? window.location.origin : 'http://localhost:3004');
 // @ts-ignore - Vite env variables
 const API_SECRET = import.meta.env.VITE_API_SECRET || '';
+// Must match the server's MAX_INJECTED_CONTEXT_LENGTH
+// @ts-ignore - Vite env variables
+export const MAX_INJECTED_CONTEXT_LENGTH = parseInt(import.meta.env.VITE_MAX_INJECTED_CONTEXT_LENGTH || '4096');
 
 export const api = axios.create({
   baseURL: API_BASE_URL,
@@ -0,0 +1,29 @@
+// Shared formatters: toLocale*String with options builds a new Intl.DateTimeFormat per call
+const timeFormatter = new Intl.DateTimeFormat('en-US', {
+  hour: 'numeric',
+  minute: '2-digit',
+  hour12: true
+});
+
+const dateTimeFormatter = new Intl.DateTimeFormat('en-US', {
+  month: 'short',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: '2-digit',
+  hour12: true
+});
+
+const shortDateFormatter = new Intl.DateTimeFormat('en-US', {
+  month: 'short',
+  day: 'numeric'
+});
+
+// Intl.DateTimeFormat.format throws on invalid dates, where toLocale*String returned 'Invalid Date'
+const format = (formatter: Intl.DateTimeFormat, date: Date) =>
+  isNaN(date.getTime()) ? 'Invalid Date' : formatter.format(date);
+
+export const formatTime = (date: Date) => format(timeFormatter, date);
+
+export const formatDateTime = (date: Date) => format(dateTimeFormatter, date);
+
+export const formatShortDate = (date: Date) => format(shortDateFormatter, date);
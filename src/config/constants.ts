@@ -49,6 +49,17 @@ export const MAX_OUTGOING_CALL_DURATION = parseInt(process.env.MAX_OUTGOING_CALL
 // Maximum duration for incoming calls in seconds (auto-hangup after this)
 export const MAX_INCOMING_CALL_DURATION = parseInt(process.env.MAX_INCOMING_CALL_DURATION || '1800'); // 30 minutes default
 
+// Maximum length of operator context injected into a live call
+// Rejects oversized payloads before they are relayed to the voice provider
+export const MAX_INJECTED_CONTEXT_LENGTH = parseInt(process.env.MAX_INJECTED_CONTEXT_LENGTH || '4096');
+
+// DTMF digits (0-9, *, #, A-D, w, W), shared by the REST endpoint and the MCP tool
+export const DTMF_PATTERN = /^[0-9*#A-DwW ]+$/;
+export const INVALID_DTMF_MESSAGE = 'Invalid DTMF digits. Allowed: 0-9, *, #, A-D, w (0.5s pause), W (1s pause)';
+
+// Strips formatting from phone numbers
+export const NON_DIGIT_PATTERN = /\D/g;
+
 // Test receiver endpoint (optional for internal testing)
 export const ENABLE_TEST_RECEIVER = process.env.ENABLE_TEST_RECEIVER === 'true';
 
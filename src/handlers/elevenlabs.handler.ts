@@ -2,7 +2,7 @@ import { WebSocket } from 'ws';
 import twilio from 'twilio';
 import dotenv from 'dotenv';
 import { CallState, CallType, ElevenLabsConfig } from '../types.js';
-import { ELEVENLABS_API_KEY, ELEVENLABS_DEFAULT_AGENT_ID, MAX_OUTGOING_CALL_DURATION, MAX_INCOMING_CALL_DURATION, GOODBYE_PHRASES } from '../config/constants.js';
+import { ELEVENLABS_API_KEY, ELEVENLABS_DEFAULT_AGENT_ID, MAX_OUTGOING_CALL_DURATION, MAX_INCOMING_CALL_DURATION } from '../config/constants.js';
 import { ElevenLabsWsService } from '../services/elevenlabs/ws.service.js';
 import { ElevenLabsEventService } from '../services/elevenlabs/event.service.js';
 import { TwilioWsService } from '../services/twilio/ws.service.js';
@@ -11,6 +11,7 @@ import { TwilioCallService } from '../services/twilio/call.service.js';
 import { CallTranscriptService } from '../services/database/call-transcript.service.js';
 import { ContextService } from '../services/context.service.js';
 import { ICallHandler } from './call.handler.js';
+import { checkForGoodbye } from '../utils/call-utils.js';
 
 dotenv.config();
 
@@ -300,8 +301,10 @@ export class ElevenLabsCallHandler implements ICallHandler {
     }
 
     private flushAudioBuffer(): void {
-        while (this.audioBuffer.length > 0) {
-            const audioPayload = this.audioBuffer.shift();
+        // Walk the buffer once and drop it, rather than shift() per packet (O(n) each)
+        const buffered = this.audioBuffer;
+        this.audioBuffer = [];
+        for (const audioPayload of buffered) {
             if (audioPayload) {
                 this.elevenLabsService.sendAudio(audioPayload);
             }
@@ -322,9 +325,7 @@ export class ElevenLabsCallHandler implements ICallHandler {
      * Check transcript for goodbye phrases and end the call if detected
      */
     private checkGoodbye(text: string, speaker: string): void {
-        const lower = text.toLowerCase();
-        const isGoodbye = GOODBYE_PHRASES.some(phrase => lower.includes(phrase));
-        if (isGoodbye) {
+        if (checkForGoodbye(text)) {
             console.log(`[ElevenLabs Handler] Goodbye detected from ${speaker}: "${text}"`);
             // Small delay to let the final audio play
             setTimeout(() => this.endCall(), 2000);
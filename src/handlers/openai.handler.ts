@@ -11,6 +11,8 @@ import { TwilioEventService } from '../services/twilio/event.service.js';
 import { SessionManagerService } from '../services/session-manager.service.js';
 import { TwilioCallService } from '../services/twilio/call.service.js';
 import { CallTranscriptService } from '../services/database/call-transcript.service.js';
+import { SocketService } from '../services/socket.service.js';
+import { CallStateService } from '../services/call-state.service.js';
 import { ICallHandler } from './call.handler.js';
 
 dotenv.config();
@@ -88,8 +90,6 @@ export class OpenAICallHandler implements ICallHandler {
         const duration = Math.floor((endTime.getTime() - this.callStartTime.getTime()) / 1000);
 
         // Update CallStateService and emit via Socket.IO
-        const { CallStateService } = await import('../services/call-state.service.js');
-        const { SocketService } = await import('../services/socket.service.js');
         const callStateService = CallStateService.getInstance();
         const socketService = SocketService.getInstance();
 
@@ -239,12 +239,15 @@ export class OpenAICallHandler implements ICallHandler {
     }
 
     private flushAudioBuffer(): void {
-        while (this.audioBuffer.length > 0) {
-            const audioPayload = this.audioBuffer.shift();
-            if (audioPayload) {
-                this.openAIService.sendAudio(audioPayload);
-            }
+        const buffered = this.audioBuffer.filter(Boolean);
+        this.audioBuffer = [];
+        if (buffered.length === 0) {
+            return;
         }
+
+        // Coalesce the buffered µ-law packets into a single append instead of one frame per packet
+        const audio = Buffer.concat(buffered.map(payload => Buffer.from(payload, 'base64')));
+        this.openAIService.sendAudio(audio.toString('base64'));
     }
 
     private handleSpeechStartedEvent(): void {
@@ -259,7 +262,6 @@ export class OpenAICallHandler implements ICallHandler {
         // Emit interruption marker whenever user starts speaking during/after assistant response
         // This shows in the transcript even if we can't technically truncate
         if (this.callState.callSid && this.callState.lastAssistantItemId) {
-            const SocketService = require('../services/socket.service.js').SocketService;
             const socketService = SocketService.getInstance();
             socketService.emitTranscriptUpdate(this.callState.callSid, {
                 speaker: 'system',
@@ -427,7 +429,6 @@ export class OpenAICallHandler implements ICallHandler {
 
                 // Check if the call is on hold - if so, don't end it
                 if (this.callState.callSid) {
-                    const { CallStateService } = await import('../services/call-state.service.js');
                     const callStateService = CallStateService.getInstance();
                     const call = callStateService.getCall(this.callState.callSid);
 
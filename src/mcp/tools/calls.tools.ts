@@ -4,6 +4,7 @@ import { CallTranscriptService } from '../../services/database/call-transcript.s
 import { TwilioCallService } from '../../services/twilio/call.service.js';
 import { CallStateService } from '../../services/call-state.service.js';
 import { SessionManagerService } from '../../services/session-manager.service.js';
+import { MAX_INJECTED_CONTEXT_LENGTH, DTMF_PATTERN, INVALID_DTMF_MESSAGE } from '../../config/constants.js';
 
 /**
  * Call Management Tools
@@ -131,7 +132,7 @@ export const callToolsDefinitions: MCPToolDefinition[] = [
                 },
                 context: {
                     type: 'string',
-                    description: 'Instructions or context to inject into the conversation'
+                    description: `Instructions or context to inject into the conversation (max ${MAX_INJECTED_CONTEXT_LENGTH} characters)`
                 }
             },
             required: ['callSid', 'context']
@@ -463,6 +464,10 @@ export function createCallToolHandlers(
             try {
                 validateArgs(args, ['callSid', 'context']);
 
+                if (args.context.length > MAX_INJECTED_CONTEXT_LENGTH) {
+                    return createToolError(`Context too long (${args.context.length} characters). Maximum is ${MAX_INJECTED_CONTEXT_LENGTH} characters.`);
+                }
+
                 // Get conversation history from CallStateService
                 const callStateService = CallStateService.getInstance();
                 const call = callStateService.getCall(args.callSid);
@@ -534,9 +539,8 @@ export function createCallToolHandlers(
                 validateArgs(args, ['callSid', 'digits']);
 
                 // Validate DTMF digits
-                const validDTMF = /^[0-9*#A-DwW ]+$/;
-                if (!validDTMF.test(args.digits)) {
-                    return createToolError('Invalid DTMF digits. Allowed: 0-9, *, #, A-D, w (0.5s pause), W (1s pause)');
+                if (!DTMF_PATTERN.test(args.digits)) {
+                    return createToolError(INVALID_DTMF_MESSAGE);
                 }
 
                 // Get call from CallStateService
@@ -1,4 +1,7 @@
 import { MCPToolCallResponse, MCPResourceReadResponse } from './types.js';
+import { NON_DIGIT_PATTERN } from '../config/constants.js';
+
+const RESOURCE_URI_PATTERN = /^([a-z]+):\/\/(.+)$/;
 
 /**
  * Create a successful tool response
@@ -50,7 +53,7 @@ export function createResourceResponse(uri: string, data: any, mimeType = 'appli
  *   call://CA123/transcript -> { scheme: 'call', path: 'CA123/transcript' }
  */
 export function parseResourceURI(uri: string): { scheme: string; path: string } {
-    const match = uri.match(/^([a-z]+):\/\/(.+)$/);
+    const match = uri.match(RESOURCE_URI_PATTERN);
     if (!match) {
         throw new Error(`Invalid resource URI: ${uri}`);
     }
@@ -76,7 +79,7 @@ export function validateArgs(args: Record<string, any>, required: string[]): voi
  */
 export function sanitizePhoneNumber(phone: string): string {
     // Remove all non-digit characters
-    const digits = phone.replace(/\D/g, '');
+    const digits = phone.replace(NON_DIGIT_PATTERN, '');
 
     // If it doesn't start with +, add it
     if (!phone.startsWith('+')) {
@@ -7,7 +7,7 @@ import path from 'path';
 import twilio from 'twilio';
 import { Server as HTTPServer } from 'http';
 import { CallType } from '../types.js';
-import { DYNAMIC_API_SECRET, ENABLE_TEST_RECEIVER, DEFAULT_INCOMING_CALL_MESSAGE, DEFAULT_INCOMING_CALL_VOICE } from '../config/constants.js';
+import { DYNAMIC_API_SECRET, ENABLE_TEST_RECEIVER, DEFAULT_INCOMING_CALL_MESSAGE, DEFAULT_INCOMING_CALL_VOICE, MAX_INJECTED_CONTEXT_LENGTH, DTMF_PATTERN, INVALID_DTMF_MESSAGE } from '../config/constants.js';
 import { CreateSessionOptions, CallSessionManager } from '../services/session-manager.service.js';
 import { TwilioCallService } from '../services/twilio/call.service.js';
 import { TwilioSmsService } from '../services/twilio/sms.service.js';
@@ -22,6 +22,66 @@ import { createMCPRouter } from '../mcp/router.js';
 import { VoicemailService } from '../services/voicemail/voicemail.service.js';
 dotenv.config();
 
+// TwiML documents that don't depend on the request are rendered once at startup
+const HOLD_LOOP_TWIML = buildHoldLoopTwiml();
+const TEST_RECEIVER_TWIML = buildTestReceiverTwiml();
+const CAPACITY_REJECTED_TWIML = buildCapacityRejectedTwiml();
+const DEFAULT_INCOMING_CALL_TWIML = buildDefaultIncomingCallTwiml();
+
+function buildHoldLoopTwiml(): string {
+    const twiml = new VoiceResponse();
+
+    // Play hold music continuously
+    twiml.play({ loop: 0 }, 'http://com.twilio.sounds.music.s3.amazonaws.com/MARKOVICHAMP-Borghestral.mp3');
+
+    return twiml.toString();
+}
+
+function buildTestReceiverTwiml(): string {
+    const twiml = new VoiceResponse();
+
+    // Play greeting message
+    twiml.say(
+        { voice: 'Polly.Matthew' },
+        'This is the Phony test receiver. Your call has been answered successfully. This line will remain open for testing purposes and will automatically disconnect after the timeout period.'
+    );
+
+    // Brief pause
+    twiml.pause({ length: 2 });
+
+    // Play hold music for limited duration (using timeout to control max duration)
+    // Note: Twilio will enforce the timeout via the call duration limit
+    twiml.play(
+        { loop: 5 },
+        'http://com.twilio.sounds.music.s3.amazonaws.com/MARKOVICHAMP-Borghestral.mp3'
+    );
+
+    // Say goodbye message before hanging up
+    twiml.say(
+        { voice: 'Polly.Matthew' },
+        'Test call timeout reached. Disconnecting now. Thank you for testing.'
+    );
+
+    // Hangup
+    twiml.hangup();
+
+    return twiml.toString();
+}
+
+function buildCapacityRejectedTwiml(): string {
+    const twiml = new VoiceResponse();
+    twiml.say('Sorry, we are currently at maximum capacity. Please try again later.');
+    twiml.hangup();
+    return twiml.toString();
+}
+
+function buildDefaultIncomingCallTwiml(): string {
+    const twiml = new VoiceResponse();
+    twiml.say({ voice: DEFAULT_INCOMING_CALL_VOICE as any }, DEFAULT_INCOMING_CALL_MESSAGE);
+    twiml.hangup();
+    return twiml.toString();
+}
+
 export class VoiceServer {
     private app: express.Application & { ws: any };
     private port: number;
@@ -339,14 +399,8 @@ export class VoiceServer {
 
         console.log('[Voice Server] Creating hold loop');
 
-        // Create TwiML for hold with music
-        const twiml = new VoiceResponse();
-
-        // Play hold music continuously
-        twiml.play({ loop: 0 }, 'http://com.twilio.sounds.music.s3.amazonaws.com/MARKOVICHAMP-Borghestral.mp3');
-
         res.writeHead(200, { 'Content-Type': 'text/xml' });
-        res.end(twiml.toString());
+        res.end(HOLD_LOOP_TWIML);
     }
 
     /**
@@ -356,39 +410,10 @@ export class VoiceServer {
     private async handleTestReceiver(req: express.Request, res: Response): Promise<void> {
         console.log('[Voice Server] Test receiver endpoint called');
         console.log('[Voice Server] From:', req.body.From, 'To:', req.body.To);
-
-        // Create TwiML response
-        const twiml = new VoiceResponse();
-
-        // Play greeting message
-        twiml.say(
-            { voice: 'Polly.Matthew' },
-            'This is the Phony test receiver. Your call has been answered successfully. This line will remain open for testing purposes and will automatically disconnect after the timeout period.'
-        );
-
-        // Brief pause
-        twiml.pause({ length: 2 });
-
-        // Play hold music for limited duration (using timeout to control max duration)
-        // Note: Twilio will enforce the timeout via the call duration limit
-        twiml.play(
-            { loop: 5 },
-            'http://com.twilio.sounds.music.s3.amazonaws.com/MARKOVICHAMP-Borghestral.mp3'
-        );
-
-        // Say goodbye message before hanging up
-        twiml.say(
-            { voice: 'Polly.Matthew' },
-            'Test call timeout reached. Disconnecting now. Thank you for testing.'
-        );
-
-        // Hangup
-        twiml.hangup();
-
         console.log('[Voice Server] Test receiver TwiML generated (max duration: ~5 minutes)');
 
         res.writeHead(200, { 'Content-Type': 'text/xml' });
-        res.end(twiml.toString());
+        res.end(TEST_RECEIVER_TWIML);
     }
 
     private handleOutgoingConnection(ws: WebSocket, req: express.Request): void {
@@ -689,6 +714,11 @@ export class VoiceServer {
                 return;
             }
 
+            if (context.length > MAX_INJECTED_CONTEXT_LENGTH) {
+                res.status(400).json({ error: `Context too long (${context.length} characters). Maximum is ${MAX_INJECTED_CONTEXT_LENGTH} characters.` });
+                return;
+            }
+
             const call = this.callStateService.getCall(callSid);
 
             if (!call) {
@@ -813,9 +843,8 @@ export class VoiceServer {
             }
 
             // Validate DTMF digits (0-9, *, #, A-D, w, W)
-            const validDTMF = /^[0-9*#A-DwW ]+$/;
-            if (!validDTMF.test(digits)) {
-                res.status(400).json({ error: 'Invalid DTMF digits. Allowed: 0-9, *, #, A-D, w (0.5s pause), W (1s pause)' });
+            if (!DTMF_PATTERN.test(digits)) {
+                res.status(400).json({ error: INVALID_DTMF_MESSAGE });
                 return;
             }
 
@@ -1115,11 +1144,8 @@ export class VoiceServer {
                 incomingCalls: this.callStateService.getIncomingCallCount()
             };
             console.log('[Voice Server] ⚠️  Incoming call rejected - limit reached', stats);
-            const twiml = new VoiceResponse();
-            twiml.say('Sorry, we are currently at maximum capacity. Please try again later.');
-            twiml.hangup();
             res.writeHead(200, { 'Content-Type': 'text/xml' });
-            res.end(twiml.toString());
+            res.end(CAPACITY_REJECTED_TWIML);
             return;
         }
 
@@ -1129,11 +1155,8 @@ export class VoiceServer {
         if (!config) {
             // Default behavior: Play SMS redirect message and hang up
             console.log('[Voice Server] No configuration found for', toNumber, '- playing SMS redirect message');
-            const twiml = new VoiceResponse();
-            twiml.say({ voice: DEFAULT_INCOMING_CALL_VOICE as any }, DEFAULT_INCOMING_CALL_MESSAGE);
-            twiml.hangup();
             res.writeHead(200, { 'Content-Type': 'text/xml' });
-            res.end(twiml.toString());
+            res.end(DEFAULT_INCOMING_CALL_TWIML);
             return;
         }
 
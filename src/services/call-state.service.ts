@@ -13,7 +13,7 @@ export interface ActiveCall {
     elevenLabsVoiceId?: string;  // ElevenLabs voice ID
     startedAt: Date;
     maxDurationTimer?: NodeJS.Timeout;  // Auto-hangup timer
-    conversationHistory: Array<{ role: string; content: string; timestamp: Date }>;
+    conversationHistory: Array<{ role: string; content: string; timestamp: Date; truncated?: boolean; truncatedAt?: number }>;
     pendingContextRequest?: {
         question: string;
         requestedAt: Date;
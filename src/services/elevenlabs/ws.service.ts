@@ -1,6 +1,11 @@
 import { WebSocket } from 'ws';
 import { convertTwilioToElevenLabs } from './audio.service.js';
 
+// Pre-encoded envelope for user audio frames. The PCM payload is base64 we
+// encode ourselves in convertTwilioToElevenLabs, so it never needs JSON escaping.
+const USER_AUDIO_PREFIX = '{"user_audio_chunk":"';
+const USER_AUDIO_SUFFIX = '"}';
+
 /**
  * Configuration for ElevenLabs Conversational AI WebSocket
  */
@@ -90,7 +95,9 @@ export class ElevenLabsWsService {
      */
     private handleMessage(data: WebSocket.Data): void {
         try {
-            const message = JSON.parse(data.toString());
+            // Keep the raw frame text so diagnostics don't re-serialize the parsed message
+            const raw = data.toString();
+            const message = JSON.parse(raw);
 
             switch (message.type) {
                 case 'conversation_initiation_metadata':
@@ -179,12 +186,12 @@ export class ElevenLabsWsService {
                     break;
 
                 case 'error':
-                    console.error('[ElevenLabs WS] Error from server:', JSON.stringify(message));
-                    this.callbacks?.onError(new Error(message.error?.message || JSON.stringify(message)));
+                    console.error('[ElevenLabs WS] Error from server:', raw);
+                    this.callbacks?.onError(new Error(message.error?.message || raw));
                     break;
 
                 default:
-                    console.log('[ElevenLabs WS] Unhandled message type:', message.type, JSON.stringify(message).substring(0, 200));
+                    console.log('[ElevenLabs WS] Unhandled message type:', message.type, raw.substring(0, 200));
             }
         } catch (error) {
             console.error('[ElevenLabs WS] Error parsing message:', error);
@@ -283,11 +290,7 @@ export class ElevenLabsWsService {
         // Convert Twilio µ-law 8kHz to PCM 16kHz for ElevenLabs
         const pcmBase64 = convertTwilioToElevenLabs(twilioBase64Audio);
 
-        const audioMessage = {
-            user_audio_chunk: pcmBase64
-        };
-
-        this.webSocket.send(JSON.stringify(audioMessage));
+        this.webSocket.send(USER_AUDIO_PREFIX + pcmBase64 + USER_AUDIO_SUFFIX);
     }
 
     /**
@@ -323,8 +326,9 @@ export class ElevenLabsWsService {
             is_error: isError || false
         };
 
-        console.log('[ElevenLabs WS] Sending tool result:', JSON.stringify(resultMessage));
-        this.webSocket.send(JSON.stringify(resultMessage));
+        const encoded = JSON.stringify(resultMessage);
+        console.log('[ElevenLabs WS] Sending tool result:', encoded);
+        this.webSocket.send(encoded);
     }
 
     /**
@@ -1,8 +1,18 @@
 import { WebSocket } from 'ws';
 import { CallState } from '../../types.js';
 import { LOG_EVENT_TYPES, SHOW_TIMING_MATH } from '../../config/constants.js';
-import { checkForGoodbye } from '../../utils/call-utils.js';
+import { buildPhrasePattern, checkForGoodbye } from '../../utils/call-utils.js';
 import { SocketService } from '../socket.service.js';
+import { CallStateService } from '../call-state.service.js';
+
+// Only auto-hangup on very explicit user requests to end the call
+// This prevents false positives from casual use of "bye" or "goodbye" in conversation
+const EXPLICIT_HANGUP_PATTERN = buildPhrasePattern([
+    'hang up now',
+    'end the call now',
+    'disconnect now',
+    'terminate the call'
+]);
 
 /**
  * Service for processing OpenAI events
@@ -131,7 +141,6 @@ export class OpenAIEventService {
             });
 
             // Also update the CallStateService
-            const CallStateService = require('../call-state.service.js').CallStateService;
             const callStateService = CallStateService.getInstance();
             callStateService.addTranscript(this.callState.callSid, {
                 role: message.role,
@@ -139,19 +148,7 @@ export class OpenAIEventService {
             });
         }
 
-        // Only auto-hangup on very explicit user requests to end the call
-        // This prevents false positives from casual use of "bye" or "goodbye" in conversation
-        const explicitHangupPhrases = [
-            'hang up now',
-            'end the call now',
-            'disconnect now',
-            'terminate the call'
-        ];
-        const shouldHangup = explicitHangupPhrases.some(phrase =>
-            transcription.toLowerCase().includes(phrase)
-        );
-
-        if (shouldHangup) {
+        if (EXPLICIT_HANGUP_PATTERN.test(transcription)) {
             console.log('[Call Handler] User explicitly requested call termination:', transcription);
             this.onEndCall();
         }
@@ -194,7 +191,6 @@ export class OpenAIEventService {
             });
 
             // Also update the CallStateService
-            const CallStateService = require('../call-state.service.js').CallStateService;
             const callStateService = CallStateService.getInstance();
             callStateService.addTranscript(this.callState.callSid, {
                 role: message.role,
@@ -237,7 +233,6 @@ export class OpenAIEventService {
                 });
 
                 // Also update CallStateService
-                const CallStateService = require('../call-state.service.js').CallStateService;
                 const callStateService = CallStateService.getInstance();
                 const activeCall = callStateService.getCall(this.callState.callSid);
                 if (activeCall && activeCall.conversationHistory[messageIndex]) {
@@ -2,6 +2,9 @@ import { WebSocket } from 'ws';
 import { OpenAIConfig } from '../../types.js';
 import { SHOW_TIMING_MATH } from '../../config/constants.js';
 
+// Fixed head of every input_audio_buffer.append frame; only the audio value varies
+const AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":';
+
 /**
  * Service for handling OpenAI API interactions
  */
@@ -129,15 +132,11 @@ export class OpenAIWsService {
             return;
         }
 
-        const audioAppend = {
-            type: 'input_audio_buffer.append',
-            audio: audioPayload
-        };
-
         // Reduced logging - audio sending is very frequent
         // Only log errors, not every audio packet
 
-        this.webSocket.send(JSON.stringify(audioAppend));
+        // The payload arrives from the Twilio media socket, so it is still JSON-escaped
+        this.webSocket.send(AUDIO_APPEND_PREFIX + JSON.stringify(audioPayload) + '}');
     }
 
     /**
@@ -157,11 +156,13 @@ export class OpenAIWsService {
             audio_end_ms: elapsedTime
         };
 
+        const encoded = JSON.stringify(truncateEvent);
+
         if (SHOW_TIMING_MATH) {
-            console.error('Sending truncation event:', JSON.stringify(truncateEvent));
+            console.error('Sending truncation event:', encoded);
         }
 
-        this.webSocket.send(JSON.stringify(truncateEvent));
+        this.webSocket.send(encoded);
     }
 
     /**
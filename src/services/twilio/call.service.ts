@@ -1,4 +1,5 @@
 import twilio from 'twilio';
+import VoiceResponse from 'twilio/lib/twiml/VoiceResponse.js';
 import { DYNAMIC_API_SECRET, RECORD_CALLS } from '../../config/constants.js';
 
 /**
@@ -191,7 +192,6 @@ export class TwilioCallService {
 
         try {
             // Create TwiML to play DTMF tones
-            const VoiceResponse = (await import('twilio/lib/twiml/VoiceResponse.js')).default;
             const twiml = new VoiceResponse();
             twiml.play({ digits });
 
@@ -220,7 +220,6 @@ export class TwilioCallService {
         }
 
         try {
-            const VoiceResponse = (await import('twilio/lib/twiml/VoiceResponse.js')).default;
             const twiml = new VoiceResponse();
 
             twiml.say({ voice: 'Polly.Matthew' }, 'One moment please.');
@@ -248,7 +247,6 @@ export class TwilioCallService {
 
         try {
             // Create TwiML to redirect back to the media stream
-            const VoiceResponse = (await import('twilio/lib/twiml/VoiceResponse.js')).default;
             const twiml = new VoiceResponse();
 
             // Redirect back to the media stream to resume AI conversation
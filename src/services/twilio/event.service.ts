@@ -83,14 +83,15 @@ export class TwilioEventService {
      * @param data The event data
      */
     private async handleMediaEvent(data: any): Promise<void> {
-        this.callState.latestMediaTimestamp = data.media.timestamp;
+        const media = data.media;
+        this.callState.latestMediaTimestamp = media.timestamp;
         // Reduced logging - only log every 50th packet to avoid spam
-        if (SHOW_TIMING_MATH && data.media.timestamp % 1000 === 0) {
+        if (SHOW_TIMING_MATH && media.timestamp % 1000 === 0) {
             console.log(`[Twilio Media] Received audio, timestamp: ${this.callState.latestMediaTimestamp}ms`);
         }
 
         await this.handleFirstMediaEventIfNeeded();
-        this.onForwardAudio(data.media.payload);
+        this.onForwardAudio(media.payload);
     }
 
     /**
@@ -120,24 +121,27 @@ export class TwilioEventService {
      * @param data The event data
      */
     private async handleStartEvent(data: any): Promise<void> {
-        this.callState.streamSid = data.start.streamSid;
+        const start = data.start;
+        const params = start.customParameters;
+
+        this.callState.streamSid = start.streamSid;
         this.callState.responseStartTimestampTwilio = null;
         this.callState.latestMediaTimestamp = 0;
 
-        this.contextService.initializeCallState(this.callState, data.start.customParameters.fromNumber, data.start.customParameters.toNumber);
+        this.contextService.initializeCallState(this.callState, params.fromNumber, params.toNumber);
 
         // Extract ElevenLabs parameters from stream custom parameters
-        if (data.start.customParameters.elevenLabsAgentId) {
-            this.callState.elevenLabsAgentId = data.start.customParameters.elevenLabsAgentId;
+        if (params.elevenLabsAgentId) {
+            this.callState.elevenLabsAgentId = params.elevenLabsAgentId;
         }
-        if (data.start.customParameters.elevenLabsVoiceId) {
-            this.callState.elevenLabsVoiceId = data.start.customParameters.elevenLabsVoiceId;
+        if (params.elevenLabsVoiceId) {
+            this.callState.elevenLabsVoiceId = params.elevenLabsVoiceId;
             console.log('[Twilio Start] ElevenLabs voice ID:', this.callState.elevenLabsVoiceId);
         }
 
         // Use systemInstructions and callInstructions if provided (new context system)
-        const systemInstructions = data.start.customParameters.systemInstructions;
-        const callInstructions = data.start.customParameters.callInstructions || '';
+        const systemInstructions = params.systemInstructions;
+        const callInstructions = params.callInstructions || '';
 
         if (systemInstructions) {
             console.log('[Twilio Start] Using custom context with systemInstructions and callInstructions');
@@ -145,11 +149,11 @@ export class TwilioEventService {
         } else {
             // Fallback for old format (will be removed once UI is updated)
             console.error('[Twilio Start] WARNING: Old format detected. Using callContext parameter.');
-            const legacyContext = data.start.customParameters.callContext || 'Have a natural conversation.';
+            const legacyContext = params.callContext || 'Have a natural conversation.';
             this.contextService.setupCallContext(this.callState, legacyContext, 'Hello!');
         }
 
-        this.callState.callSid = data.start.callSid;
+        this.callState.callSid = start.callSid;
 
         // For incoming calls, add to CallStateService and start duration timer
         if (this.callState.callType === 'INBOUND') {
@@ -159,8 +163,8 @@ export class TwilioEventService {
             callStateService.addCall(this.callState.callSid, {
                 callSid: this.callState.callSid,
                 twilioCallSid: this.callState.callSid,
-                toNumber: data.start.customParameters.toNumber,
-                fromNumber: data.start.customParameters.fromNumber,
+                toNumber: params.toNumber,
+                fromNumber: params.fromNumber,
                 callType: 'incoming',
                 status: 'in-progress',
                 startedAt: new Date(),
@@ -1,7 +1,9 @@
 import twilio from 'twilio';
 import { SmsDirection, SmsStatus } from '../../types.js';
 import { SmsStorageService } from '../sms/storage.service.js';
-import { SMS_ENABLED_NUMBERS, SMS_PROXY_TARGET_NUMBER, SMS_PROXY_ENABLED } from '../../config/constants.js';
+import { SMS_ENABLED_NUMBERS, SMS_PROXY_TARGET_NUMBER, SMS_PROXY_ENABLED, NON_DIGIT_PATTERN } from '../../config/constants.js';
+
+const REPLY_CODE_PATTERN = /^(\d{4})[:.\s]\s*([\s\S]*)$/;
 
 /**
  * Service for handling Twilio SMS operations
@@ -28,7 +30,7 @@ export class TwilioSmsService {
      */
     private static getCodeFromNumber(phoneNumber: string): string {
         // Remove non-digits and get last 4
-        const digits = phoneNumber.replace(/\D/g, '');
+        const digits = phoneNumber.replace(NON_DIGIT_PATTERN, '');
         return digits.slice(-4);
     }
 
@@ -69,7 +71,7 @@ export class TwilioSmsService {
      */
     private static parseReplyCode(body: string): { code: string; message: string } | null {
         // Match 4-digit code at start followed by : . or space
-        const match = body.match(/^(\d{4})[:.\s]\s*([\s\S]*)$/);
+        const match = body.match(REPLY_CODE_PATTERN);
         if (match) {
             const code = match[1];
             const message = match[2].trim();
@@ -86,7 +88,24 @@ export class TwilioSmsService {
      * @returns True if valid, false otherwise
      */
     private isValidE164(phoneNumber: string): boolean {
-        return /^\+[1-9]\d{1,14}$/.test(phoneNumber);
+        // Equivalent to /^\+[1-9]\d{1,14}$/ as a plain length + character scan
+        const length = phoneNumber.length;
+        if (length < 3 || length > 16 || phoneNumber[0] !== '+') {
+            return false;
+        }
+
+        const first = phoneNumber.charCodeAt(1);
+        if (first < 49 || first > 57) { // '1'..'9'
+            return false;
+        }
+
+        for (let i = 2; i < length; i++) {
+            const code = phoneNumber.charCodeAt(i);
+            if (code < 48 || code > 57) { // '0'..'9'
+                return false;
+            }
+        }
+        return true;
     }
 
     /**
@@ -8,6 +8,9 @@ import { SHOW_TIMING_MATH } from '../../config/constants.js';
 export class TwilioWsService {
     private readonly webSocket: WebSocket;
     private readonly callState: CallState;
+    // Pre-encoded media frame prefix, rebuilt only when the stream SID changes
+    private mediaPrefix = '';
+    private mediaPrefixStreamSid = '';
 
     /**
      * Create a new Twilio stream service
@@ -58,12 +61,13 @@ export class TwilioWsService {
             return;
         }
 
-        const audioDelta = {
-            event: 'media',
-            streamSid: this.callState.streamSid,
-            media: { payload }
-        };
-        this.webSocket.send(JSON.stringify(audioDelta));
+        if (this.mediaPrefixStreamSid !== this.callState.streamSid) {
+            this.mediaPrefixStreamSid = this.callState.streamSid;
+            this.mediaPrefix = `{"event":"media","streamSid":${JSON.stringify(this.mediaPrefixStreamSid)},"media":{"payload":`;
+        }
+
+        // Payloads come from the AI provider's socket, so they are still JSON-escaped
+        this.webSocket.send(this.mediaPrefix + JSON.stringify(payload) + '}}');
     }
 
     /**
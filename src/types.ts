@@ -79,7 +79,7 @@ export class CallState {
         this.twilioEvents.push({
             type,
             timestamp: new Date(),
-            data: JSON.parse(JSON.stringify(data)) // Deep clone to avoid reference issues
+            data // Freshly parsed per frame and never mutated, so no clone is needed
         });
     }
 
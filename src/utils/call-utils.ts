@@ -1,9 +1,23 @@
 import { WebSocket } from 'ws';
 import { GOODBYE_PHRASES } from '../config/constants.js';
 
+/**
+ * Build a case-insensitive pattern matching any of the given phrases,
+ * so a transcript is scanned once instead of once per phrase.
+ */
+export const buildPhrasePattern = (phrases: string[]): RegExp => {
+    if (phrases.length === 0) {
+        // An empty alternation would match every string; never match instead
+        return /(?!)/;
+    }
+    const escaped = phrases.map(phrase => phrase.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    return new RegExp(escaped.join('|'), 'i');
+};
+
+const GOODBYE_PATTERN = buildPhrasePattern(GOODBYE_PHRASES);
+
 export const checkForGoodbye = (text: string): boolean => {
-    const lowercaseText = text.toLowerCase();
-    return GOODBYE_PHRASES.some(phrase => lowercaseText.includes(phrase));
+    return GOODBYE_PATTERN.test(text);
 };
 
 export const endCall = (ws: WebSocket, openAiWs: WebSocket): void => {